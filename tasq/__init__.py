@@ -3,7 +3,7 @@ from tasq.queue import TasqQueue, TasqMultiQueue
 from tasq.remote.connection import ZMQBackendConnection, BackendConnection
 from tasq.worker.jobqueue import JobQueue
 from tasq.worker.executor import ProcessQueueExecutor
-from tasq.remote.client import Client
+from tasq.remote.client import Client, ClientsGatherer
 from tasq.remote.backend import (
     RedisStoreBackend,
     RedisBackend,
@@ -82,6 +82,7 @@ def multi_queue(urls, router_class=RoundRobinRouter, signkey=None):
         isinstance(url, tuple) or isinstance(url, str) for url in urls
     ), "urls argument must be a tuple (host, push_port, pull_port) or a string"
     backends = []
+    gatherer = ClientsGatherer()
     for url in urls:
         if isinstance(url, tuple):
             host, push_port, pull_port = url
@@ -89,7 +90,8 @@ def multi_queue(urls, router_class=RoundRobinRouter, signkey=None):
                 Client(
                     ZMQBackendConnection(
                         host, push_port, pull_port, signkey=signkey
-                    )
+                    ),
+                    gatherer=gatherer,
                 )
             )
         elif isinstance(url, str):
@@ -100,7 +102,12 @@ def multi_queue(urls, router_class=RoundRobinRouter, signkey=None):
                 "tcp",
                 "unix",
             ), f"Unsupported {scheme} as backend"
-            backends.append(Client(_backends[scheme].from_url(url, signkey)))
+            backends.append(
+                Client(
+                    _backends[scheme].from_url(url, signkey),
+                    gatherer=gatherer,
+                )
+            )
     return TasqMultiQueue(
         backends,
         lambda: actor_pool(
@@ -109,4 +116,5 @@ def multi_queue(urls, router_class=RoundRobinRouter, signkey=None):
             router_class=router_class,
             clients=backends,
         ),
+        gatherer,
     )
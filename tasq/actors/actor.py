@@ -7,7 +7,7 @@ instance useful actors.
 """
 
 import uuid
-from queue import Queue
+from collections import deque
 from threading import Thread, Event
 from abc import ABC, abstractmethod
 
@@ -41,7 +41,10 @@ class Actor(ABC):
         # Assingn a default uuid name in case of no name set
         self._name = name or uuid.uuid4()
         self._is_running = False
-        self._mailbox = Queue()
+        # Single consumer mailbox, deque append/popleft are thread-safe so
+        # the only synchronization needed is an Event to wake up the consumer
+        self._mailbox = deque()
+        self._has_msg = Event()
         self._terminated = Event()
         # XXX it is really a joke at the moment but still,
         # context == actorsystem singleton
@@ -59,20 +62,27 @@ class Actor(ABC):
 
     @property
     def mailbox_size(self):
-        return self._mailbox.qsize()
+        return len(self._mailbox)
 
     def send(self, msg):
         """Sends a message to the actor, effectively putting it into the
         mailbox
         """
-        self._mailbox.put(msg)
+        self._mailbox.append(msg)
+        self._has_msg.set()
 
     def recv(self):
         """Poll the mailbox for pending messages, blocking if empty. In case of
         `ActorExit` message it raises an execption and shutdown the actor
         loop
         """
-        msg = self._mailbox.get()
+        while True:
+            try:
+                msg = self._mailbox.popleft()
+                break
+            except IndexError:
+                self._has_msg.wait()
+                self._has_msg.clear()
         if msg is ActorExit:
             self._is_running = False
             raise ActorExit()
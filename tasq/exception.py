@@ -24,3 +24,11 @@ class BackendCommunicationErrorException(Exception):
 
 class ClientNotConnectedException(Exception):
     pass
+
+
+class PendingJobsFullException(Exception):
+    """Raised scheduling jobs on a disconnected client whose pending queue is
+    full, with a "raise" pending policy
+    """
+
+    pass
@@ -35,6 +35,17 @@ class Job:
 
     """
 
+    __slots__ = (
+        "_job_id",
+        "_func",
+        "_args",
+        "_delay",
+        "_kwargs",
+        "_start_time",
+        "_end_time",
+        "_status",
+    )
+
     def __init__(self, job_id, func, *args, **kwargs):
         # Assign a default uuid in case of empty name
         self._job_id = job_id or uuid.uuid4()
@@ -5,6 +5,7 @@ The main client module, provides interfaces to instantiate queues
 """
 
 from queue import Queue
+from itertools import cycle
 from threading import Thread
 from .job import Job
 from .remote.client import TasqFuture
@@ -80,9 +81,14 @@ class TasqQueue:
 
 
 class TasqMultiQueue:
-    def __init__(self, backends, router_factory):
+    def __init__(self, backends, router_factory, gatherer=None):
         # List of backend clients
         self._backends = backends
+        # Optional single gatherer of results for all backends, in place of
+        # one gatherer thread for each of them
+        self._gatherer = gatherer
+        # Round-robin iterator over backends, used by `map`
+        self._rr = cycle(self._backends)
         # Router to spread jobs
         self._router = router_factory()
 
@@ -93,10 +99,15 @@ class TasqMultiQueue:
         return any([backend.is_connected() for backend in self._backends])
 
     def connect(self):
+        # Backends sharing the gatherer start it on connection
         for backend in self._backends:
             backend.connect()
 
     def disconnect(self):
+        # Stop polling PULL sockets once, instead of restarting the gatherer
+        # on each backend disconnection
+        if self._gatherer:
+            self._gatherer.stop()
         for backend in self._backends:
             backend.disconnect()
 
@@ -108,22 +119,29 @@ class TasqMultiQueue:
 
     def shutdown(self):
         """Close all connected clients"""
-        for backend in self._backends:
-            backend.disconnect()
+        self.disconnect()
 
-    def map(self, func, iterable):
+    def map(self, func, iterable, batch=64):
         """Schedule a list of jobs represented by `iterable` in a round-robin
         manner. Can be seen as equivalent as schedule with `RoundRobinRouter`
-        routing.
+        routing, except that jobs dealt to each backend are accumulated and
+        sent `batch` at a time.
         """
-        idx = 0
-        for args, kwargs in iterable:
-            if idx == len(self._clients) - 1:
-                idx = 0
-            # Lazy check for connection
-            if not self._backends[idx].is_connected():
-                self._backends[idx].connect()
-            self._backends[idx].schedule(func, *args, **kwargs)
+        # Connect once upfront instead of checking on every job
+        self.connect()
+        rr = self._rr
+        batches = {}
+        for job_args in iterable:
+            backend = next(rr)
+            jobs = batches.setdefault(backend, [])
+            jobs.append(job_args)
+            if len(jobs) == batch:
+                backend.schedule_many(func, jobs, batch)
+                batches[backend] = []
+        # Flush what is left for each backend
+        for backend, jobs in batches.items():
+            if jobs:
+                backend.schedule_many(func, jobs, batch)
 
     def put(self, func, *args, **kwargs):
         """Schedule a job to a remote worker, without blocking. Require a
@@ -6,18 +6,30 @@ remote workers.
 """
 
 import asyncio
+import logging
+import zmq
 from concurrent.futures import Future
-from threading import Thread, Event
-from collections import deque
+from threading import Thread, Event, Condition, Lock
+from collections import deque, OrderedDict
 from ..job import Job, JobStatus
 from ..logger import get_logger
 from ..exception import (
     BackendCommunicationErrorException,
     ClientNotConnectedException,
+    PendingJobsFullException,
 )
 
 
 class TasqFuture(Future):
+
+    """Future returned by `Client.schedule`, filled by the gatherer once the
+    result of the job is back. Can be awaited from a coroutine as well, without
+    blocking the running event loop.
+    """
+
+    def __await__(self):
+        return asyncio.wrap_future(self).__await__()
+
     def unwrap(self):
         job_result = self.result()
         if job_result.outcome == JobStatus.FAILED:
@@ -46,22 +58,71 @@ class Client:
     :type signkey: str or None
     :param signkey: String representing a sign, marks bytes passing around
                     through sockets
+
+    :type max_completed: int or 1024
+    :param max_completed: The max number of completed results to keep around
+                          for lookup by name through `results`, the oldest
+                          ones are dropped first
+
+    :type gatherer: ClientsGatherer or None
+    :param gatherer: A `ClientsGatherer` shared with other clients to gather
+                     results with, if None a dedicated gatherer thread is
+                     started on connection
+
+    :type max_pending: int or 10000
+    :param max_pending: The max number of jobs to keep in the pending queue
+                        while not connected, None means unbounded
+
+    :type pending_policy: str or "discard-oldest"
+    :param pending_policy: What to do when scheduling on a full pending
+                           queue, either "discard-oldest" to drop the oldest
+                           pending jobs, "discard-new" to drop the new ones
+                           or "raise" to raise a `PendingJobsFullException`
     """
 
-    def __init__(self, connection):
+    def __init__(
+        self,
+        connection,
+        max_completed=1024,
+        gatherer=None,
+        max_pending=10000,
+        pending_policy="discard-oldest",
+    ):
+        assert pending_policy in (
+            "discard-oldest",
+            "discard-new",
+            "raise",
+        ), f"Unknown {pending_policy} pending policy"
         # Client backend dependency, can be a ZMQBackendConnection or a generic
         # BackendConnection for backends other than ZMQ
         self._connection = connection
         # Connection flag
         self._is_connected = False
-        # Results dictionary, mapping task_name -> result
+        # Results dictionary, mapping task_name -> result, for jobs still
+        # waiting for a result only
         self._results = {}
-        # Pending requests while not connected
-        self._pending = deque()
-        # Gathering results, making the client unblocking
+        # Most recently completed results, mapping task_name -> result, capped
+        # to `max_completed` entries
+        self._completed = OrderedDict()
+        self._max_completed = max_completed
+        # Notified once every scheduled job has got its result back
+        self._drained = Condition()
+        # Pending requests while not connected, capped to `max_pending`
+        # entries, appending to a full deque drops the oldest ones
+        self._pending = deque(maxlen=max_pending)
+        self._pending_policy = pending_policy
+        # Gathering results, making the client unblocking, either through a
+        # dedicated thread or through a ClientsGatherer shared with other
+        # clients
         self._gatherer = None
+        self._clients_gatherer = gatherer
         # threading.Event to run and control the gatherer loop
         self._gather_loop = Event()
+        # Outgoing sends, serialized and sent by the sender thread so that
+        # scheduling never blocks on cloudpickle or on the connection
+        self._sendq = deque()
+        self._send_ev = Event()
+        self._sender = None
         # Logging settings
         self._log = get_logger(__name__)
 
@@ -74,34 +135,128 @@ class Client:
         return self
 
     def __exit__(self, exc_type, exc_value, exc_traceback):
-        while self.pending_results():
-            pass
-        self.close()
+        self.join()
+        self.disconnect()
 
     def _gather_results(self):
         """Gathering subroutine, must be run in another thread to concurrently
         listen for results and store them into a dedicated dictionary
         """
-        while not self._gather_loop.is_set():
+        # Bind everything used on each received result once, outside of the
+        # loop
+        recv = self._connection.recv_result
+        deliver = self.deliver
+        log = self._log
+        debug_on = log.isEnabledFor(logging.DEBUG)
+        gather_loop = self._gather_loop
+        while not gather_loop.is_set():
             try:
-                job_result = self._connection.recv_result()
+                job_result = recv()
             except BackendCommunicationErrorException as e:
-                self._log.warning(
+                log.warning(
                     "Backend error while receiving results back: %s", str(e)
                 )
             else:
                 if not job_result:
                     continue
-                self._log.debug("Gathered result: %s", job_result)
-                try:
-                    self._results[job_result.name].set_result(job_result)
-                except KeyError:
-                    self._log.error(
-                        "Can't update result: key %s not found",
-                        job_result.name,
-                    )
-                except asyncio.InvalidStateError:
-                    self._log.warning("Result already gathered, discarding it")
+                if debug_on:
+                    log.debug("Gathered result: %s", job_result)
+                deliver(job_result)
+
+    def deliver(self, job_result):
+        """Set `job_result` as the result of the future it belongs to, called
+        by the gatherer thread or by a `ClientsGatherer` for each result
+        received. The future is resolved before waking up `join` waiters, the
+        condition lock is reentrant so done callbacks can use the client
+        """
+        results = self._results
+        completed = self._completed
+        with self._drained:
+            future = results.pop(job_result.name, None)
+            if future is not None:
+                completed[job_result.name] = future
+                if len(completed) > self._max_completed:
+                    completed.popitem(last=False)
+            elif job_result.name in completed:
+                self._log.warning("Result already gathered, discarding it")
+            else:
+                self._log.error(
+                    "Can't update result: key %s not found", job_result.name
+                )
+            if future is not None:
+                future.set_result(job_result)
+            if not results:
+                self._drained.notify_all()
+
+    def _send_jobs(self):
+        """Sending subroutine, must be run in another thread to serialize and
+        send jobs queued by the scheduling methods, till a `None` is found in
+        the queue
+        """
+        sendq = self._sendq
+        send_ev = self._send_ev
+        while True:
+            try:
+                item = sendq.popleft()
+            except IndexError:
+                send_ev.wait()
+                send_ev.clear()
+                continue
+            if item is None:
+                break
+            send, payload = item
+            try:
+                send(payload)
+            except Exception as e:
+                # Serialization and backend driver errors end up here too,
+                # the sender thread must survive them
+                self._log.warning("Error while sending jobs: %s", e)
+                jobs = payload if isinstance(payload, list) else [payload]
+                self._fail(jobs, e)
+
+    def _fail(self, jobs, exc):
+        """Set `exc` on the futures of `jobs`, no result will ever come back
+        for them
+        """
+        with self._drained:
+            for job in jobs:
+                future = self._results.pop(job.job_id, None)
+                if future is not None:
+                    future.set_exception(exc)
+            if not self._results:
+                self._drained.notify_all()
+
+    def _enqueue_pending(self, jobs):
+        """Append `jobs` to the pending queue, applying the pending policy if
+        there is not enough room left for all of them
+        """
+        maxlen = self._pending.maxlen
+        if maxlen is not None and len(self._pending) + len(jobs) > maxlen:
+            if self._pending_policy == "raise":
+                raise PendingJobsFullException(
+                    f"Pending queue full, can't enqueue {len(jobs)} jobs"
+                )
+            if self._pending_policy == "discard-new":
+                room = max(maxlen - len(self._pending), 0)
+                self._log.warning(
+                    "Pending queue full, discarding %s new jobs",
+                    len(jobs) - room,
+                )
+                jobs = jobs[:room]
+            else:
+                self._log.warning(
+                    "Pending queue full, discarding oldest pending jobs"
+                )
+        self._pending.extend(jobs)
+
+    def _enqueue_send(self, item):
+        """Queue `item` to the sender thread and wake it up"""
+        self._sendq.append(item)
+        self._send_ev.set()
+
+    @property
+    def connection(self):
+        return self._connection
 
     def is_connected(self):
         return self._is_connected
@@ -110,9 +265,23 @@ class Client:
         """Returns the pending jobs"""
         return self._pending
 
+    @property
+    def results(self):
+        """Return every known result, both pending and recently completed"""
+        with self._drained:
+            return {**self._completed, **self._results}
+
     def pending_results(self):
         """Retrieve pending jobs from the results dictionary"""
-        return {k: v for k, v in self._results.items() if v.done() is False}
+        with self._drained:
+            return dict(self._results)
+
+    def join(self, timeout=None):
+        """Wait till every scheduled job has got its result back, without
+        polling. Return False if `timeout` expires first, True otherwise
+        """
+        with self._drained:
+            return self._drained.wait_for(lambda: not self._results, timeout)
 
     def connect(self):
         """Connect to the remote workers, setting up PUSH and PULL channels,
@@ -120,28 +289,43 @@ class Client:
         """
         if self.is_connected():
             return
-        # Gathering results, making the client unblocking
-        if not self._gatherer:
-            self._gatherer = Thread(target=self._gather_results, daemon=True)
-            # Start gathering thread
-            self._gatherer.start()
-        elif not self._gatherer.is_alive():
+        # Gathering results, making the client unblocking, unless results
+        # are gathered by someone else
+        gather = self._clients_gatherer is None
+        if gather and not (self._gatherer and self._gatherer.is_alive()):
             self._gather_loop.clear()
+            self._gatherer = Thread(target=self._gather_results, daemon=True)
             # Start gathering thread
             self._gatherer.start()
+        # Sending jobs, making scheduling unblocking
+        self._sender = Thread(target=self._send_jobs, daemon=True)
+        self._sender.start()
         self._connection.connect()
+        if not gather:
+            # Register to the shared gatherer only after the PULL socket is
+            # connected, as it is not thread-safe
+            self._clients_gatherer.register(self)
         self._is_connected = True
-        # Check if there are pending requests and in case, empty the queue
-        while self._pending:
-            job = self._pending.pop()
-            self.schedule(job.func, *job.args, name=job.job_id, **job.kwargs)
+        # Check if there are pending requests and in case, flush them all in
+        # batches, in the same order they were scheduled
+        if self._pending:
+            jobs = list(self._pending)
+            self._pending.clear()
+            self._send_batch(jobs)
 
     def disconnect(self):
         """Disconnect PUSH and PULL sockets"""
         if self.is_connected():
+            # Flush jobs still queued for sending before disconnecting
+            self._enqueue_send(None)
+            self._sender.join()
+            if self._clients_gatherer is not None:
+                # Stop polling the PULL socket before disconnecting it
+                self._clients_gatherer.unregister(self)
             self._connection.disconnect()
-            self._gather_loop.set()
-            self._gatherer.join()
+            if self._clients_gatherer is None:
+                self._gather_loop.set()
+                self._gatherer.join()
             self._is_connected = False
 
     def schedule(self, func, *args, **kwargs):
@@ -166,18 +350,67 @@ class Client:
             self._log.debug(
                 "Client not connected, appending job to pending queue."
             )
-            self._pending.appendleft(job)
+            self._enqueue_pending([job])
             return None
         # Create a Future and return it, _gatherer thread will set the
         # result once received
         future = TasqFuture()
-        if name in self._results:
-            self._results.pop(name)
-        self._results[name] = future
-        # Send job to worker
-        self._connection.send(job)
+        with self._drained:
+            self._results[name] = future
+        # Hand the job over to the sender thread
+        self._enqueue_send((self._connection.send, job))
         return future
 
+    def schedule_many(self, func, iterable, batch=64):
+        """Schedule a job for each `(args, kwargs)` pair in `iterable`,
+        without blocking. Jobs are sent `batch` at a time through a single
+        call to the connection, amortizing the cost of a send over the whole
+        batch
+
+        Args:
+        -----
+        :type func: func
+        :param func: A function to be executed on a worker by enqueing it
+
+        :type iterable: iterable
+        :param iterable: An iterable of `(args, kwargs)` tuples, one for each
+                         job to schedule
+
+        :type batch: int or 64
+        :param batch: The max number of jobs to send at once
+
+        :rtype: list
+        :return: A list of futures eventually containing the result of each
+                 func execution, or None if the client is not connected
+        """
+        jobs = []
+        for args, kwargs in iterable:
+            kwargs = dict(kwargs)
+            jobs.append(Job(kwargs.pop("name", ""), func, *args, **kwargs))
+        # If not connected enqueue for execution at the first connection
+        if not self.is_connected():
+            self._log.debug(
+                "Client not connected, appending jobs to pending queue."
+            )
+            self._enqueue_pending(jobs)
+            return None
+        return self._send_batch(jobs, batch)
+
+    def _send_batch(self, jobs, batch=64):
+        """Create a future for each job and send them to workers, `batch`
+        jobs at a time. Return the list of futures, the _gatherer thread
+        will set their results once received
+        """
+        futures = [TasqFuture() for _ in jobs]
+        with self._drained:
+            self._results.update(
+                (job.job_id, future) for job, future in zip(jobs, futures)
+            )
+        for i in range(0, len(jobs), batch):
+            chunk = jobs[i:i + batch]
+            self._enqueue_send((self._connection.send_batch, chunk))
+        return futures
+
     def schedule_blocking(self, func, *args, **kwargs):
         """Schedule a job to a remote worker wating for the result to be ready.
         Like `schedule` it require a func task, and arguments to be passed
@@ -203,3 +436,120 @@ class Client:
         future = self.schedule(func, *args, **kwargs)
         result = future.result(timeout)
         return result
+
+
+class ClientsGatherer:
+
+    """Gather results for a group of clients connected through
+    `ZMQBackendConnection`s from a single thread, polling all of their PULL
+    sockets at once instead of running a gatherer thread for each client.
+    Clients are given the gatherer on creation and register to it on
+    connection, starting it if not already running.
+
+    Attributes
+    ----------
+    :type timeout: int or 500
+    :param timeout: Milliseconds to wait on each poll before checking for a
+                    stop request or for newly registered clients
+    """
+
+    def __init__(self, timeout=500):
+        # Registered clients, replaced by a new list on every change so that
+        # the polling thread can detect changes without locking
+        self._clients = []
+        self._timeout = timeout
+        self._thread = None
+        # Clients connect concurrently from different actors, serialize
+        # registrations, starts and stops of the polling thread
+        self._lock = Lock()
+        # threading.Event to run and control the polling loop
+        self._stop = Event()
+        self._log = get_logger(__name__)
+
+    def __repr__(self):
+        return f"ClientsGatherer({len(self._clients)} clients)"
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def register(self, client):
+        """Start gathering results for `client`, its connection must be
+        already connected. Start the polling thread if not running
+        """
+        with self._lock:
+            if client not in self._clients:
+                self._clients = self._clients + [client]
+            self._start()
+
+    def unregister(self, client):
+        """Stop gathering results for `client`, once returned its PULL socket
+        is not polled anymore and can be safely disconnected
+        """
+        with self._lock:
+            if client not in self._clients:
+                return
+            running = self.is_running()
+            self._halt()
+            self._clients = [c for c in self._clients if c is not client]
+            if running and self._clients:
+                self._start()
+
+    def start(self):
+        """Start the polling thread, if not already running"""
+        with self._lock:
+            self._start()
+
+    def stop(self):
+        """Stop the polling thread and wait for it to exit"""
+        with self._lock:
+            self._halt()
+
+    def _start(self):
+        if self.is_running():
+            return
+        self._stop.clear()
+        self._thread = Thread(target=self._gather_results, daemon=True)
+        self._thread.start()
+
+    def _halt(self):
+        if self.is_running():
+            self._stop.set()
+            self._thread.join()
+
+    def _gather_results(self):
+        """Polling subroutine, receive results from every ready socket and
+        deliver them to the client owning it
+        """
+        clients, poller, sockets = None, None, {}
+        log = self._log
+        debug_on = log.isEnabledFor(logging.DEBUG)
+        while not self._stop.is_set():
+            if clients is not self._clients:
+                # Clients registered since the last poll, rebuild the poller
+                clients = self._clients
+                poller = zmq.Poller()
+                sockets = {}
+                for client in clients:
+                    socket = client.connection.pull_socket
+                    poller.register(socket, zmq.POLLIN)
+                    sockets[socket] = client
+            if not sockets:
+                self._stop.wait(self._timeout / 1000)
+                continue
+            for socket, _ in poller.poll(self._timeout):
+                client = sockets[socket]
+                try:
+                    job_result = client.connection.recv_result(
+                        flags=zmq.NOBLOCK
+                    )
+                except BackendCommunicationErrorException as e:
+                    log.warning(
+                        "Backend error while receiving results back: %s",
+                        str(e),
+                    )
+                    continue
+                if not job_result:
+                    continue
+                if debug_on:
+                    log.debug("Gathered result: %s", job_result)
+                client.deliver(job_result)
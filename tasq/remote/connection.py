@@ -7,7 +7,7 @@ This module contains classes to define connections using zmq sockets.
 
 import sys
 import zmq
-from urllib.parse import urlparse
+from urllib.parse import urlparse, parse_qsl
 from .backend import RedisBackend, RabbitMQBackend
 from .sockets import CloudPickleContext, BackendSocket
 from ..exception import BackendCommunicationErrorException
@@ -40,6 +40,10 @@ class ZMQBackendConnection:
             f"ZMQBackendConnection({protocol}://{self._host}:{self._channel})"
         )
 
+    @property
+    def pull_socket(self):
+        return self._pull_socket
+
     def connect(self):
         """Connect to the remote workers, setting up PUSH and PULL channels
         using TCP sockets, respectively used to send tasks and to retrieve
@@ -72,6 +76,15 @@ class ZMQBackendConnection:
         except (zmq.error.ContextTerminated, zmq.error.ZMQError) as e:
             raise BackendCommunicationErrorException(str(e))
 
+    def send_batch(self, batch, flags=0):
+        """Send a list of data through the PUSH socket as a single multipart
+        message, amortizing the per-message cost over the whole batch
+        """
+        try:
+            self._push_socket.send_data_batch(batch, flags, self._signkey)
+        except (zmq.error.ContextTerminated, zmq.error.ZMQError) as e:
+            raise BackendCommunicationErrorException(str(e))
+
     def recv(self, unpickle=True, flags=0):
         """Receive data from the PULL socket, if a signkey flag is set it
         checks for integrity of the received data
@@ -91,10 +104,7 @@ class ZMQBackendConnection:
         u = urlparse(url)
         scheme = u.scheme or "zmq"
         assert scheme in ("zmq", "unix", "tcp"), f"Unsupported {scheme}"
-        extras = {
-            t.split("=")[0]: t.split("=")[1] for t in u.query.split("?") if t
-        }
-        extras = {k: v for k, v in extras.items() if k == "pull_port"}
+        extras = {k: v for k, v in parse_qsl(u.query) if k == "pull_port"}
         conn_args = {
             "host": u.hostname or "127.0.0.1",
             "push_port": u.port or 9000,
@@ -122,6 +132,10 @@ class BackendConnection:
         """
         self._backend.send_data(data, self._signkey)
 
+    def send_batch(self, batch):
+        """Send a list of data through the backend"""
+        self._backend.send_data_batch(batch, self._signkey)
+
     def send_result(self, result):
         self._backend.send_result_data(result, self._signkey)
 
@@ -149,10 +163,7 @@ class BackendConnection:
         scheme = u.scheme or "redis"
         assert scheme in ("redis", "amqp"), f"Unsupported {scheme}"
         extraparams = {
-            t.split("=")[0]: t.split("=")[1] for t in u.query.split("?") if t
-        }
-        extraparams = {
-            k: v for k, v in extraparams.items() if k in {"name", "db"}
+            k: v for k, v in parse_qsl(u.query) if k in {"name", "db", "role"}
         }
         name = extraparams.get(
             "name", "amqp-queue" if scheme == "amqp" else "redis-queue"
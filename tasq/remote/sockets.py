@@ -6,6 +6,7 @@ with cloudpickle
 """
 
 import struct
+import pickle
 import zmq
 from zmq.asyncio import Socket, Context
 
@@ -25,13 +26,30 @@ class CloudPickleSocket(zmq.Socket):
 
     def send_data(self, data, flags=0, signkey=None):
         """Serialize `data` with cloudpickle and compress it before sending
-        through the socket
+        through the socket. The pickled frame is never reused, so large ones
+        are handed to ZMQ without copying
         """
         serialized = serde.dumps(data)
         if signkey:
             signed = serde.sign(signkey.encode(), serialized)
-            return self.send_pyobj((signed, serialized), flags=flags)
-        return self.send_pyobj(serialized, flags=flags)
+            return self.send_pyobj(
+                (signed, serialized), flags=flags, copy=False
+            )
+        return self.send_pyobj(serialized, flags=flags, copy=False)
+
+    def send_data_batch(self, batch, flags=0, signkey=None):
+        """Serialize each element of `batch` like `send_data` and send them
+        all at once as frames of a single multipart message. Every frame is
+        pickled exactly as `send_pyobj` would do, so the receiving side can
+        keep reading them one by one with `recv_data`
+        """
+        frames = []
+        for data in batch:
+            payload = serde.dumps(data)
+            if signkey:
+                payload = (serde.sign(signkey.encode(), payload), payload)
+            frames.append(pickle.dumps(payload, pickle.DEFAULT_PROTOCOL))
+        return self.send_multipart(frames, flags=flags, copy=False)
 
     def recv_data(self, unpickle=True, flags=0, signkey=None):
         """Receive data from the socket, deserialize and decompress it with
@@ -123,6 +141,13 @@ class BackendSocket:
             return self._backend.put_job(frame)
         return self._backend.put_job(serialized)
 
+    def send_data_batch(self, batch, signkey=None):
+        """Serialize and enqueue each element of `batch`, backends have no
+        notion of multipart messages so every element is a distinct job
+        """
+        for data in batch:
+            self.send_data(data, signkey)
+
     def send_result_data(self, result, signkey=None):
         zipped_result = serde.dumps(result)
         if signkey:
@@ -0,0 +1,43 @@
+import unittest
+import threading
+from tasq.actors.actor import Actor
+
+
+class RecordingActor(Actor):
+    def __init__(self):
+        super().__init__(name="recorder")
+        self.received = []
+
+    def run(self):
+        while True:
+            self.received.append(self.recv())
+
+
+class TestActor(unittest.TestCase):
+    def test_actor_concurrent_send(self):
+        producers, messages = 8, 2000
+        actor = RecordingActor()
+        actor.start()
+        self.assertTrue(actor.is_running)
+
+        def produce(p):
+            for i in range(messages):
+                actor.send((p, i))
+
+        threads = [
+            threading.Thread(target=produce, args=(p,))
+            for p in range(producers)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        actor.close()
+        actor.join()
+        self.assertFalse(actor.is_running)
+        self.assertEqual(actor.mailbox_size, 0)
+        self.assertEqual(len(actor.received), producers * messages)
+        # Messages from each producer arrive in the order they were sent
+        for p in range(producers):
+            sequence = [i for q, i in actor.received if q == p]
+            self.assertEqual(sequence, list(range(messages)))
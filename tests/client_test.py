@@ -1,7 +1,18 @@
 import time
+import asyncio
 import unittest
 import threading
-from tasq.remote.client import Client, TasqFuture
+from unittest.mock import patch
+import zmq
+import tasq.remote.serializer as serde
+from tasq.job import JobResult
+from tasq.remote.sockets import CloudPickleContext
+from tasq.remote.connection import ZMQBackendConnection
+from tasq.remote.client import Client, TasqFuture, ClientsGatherer
+from tasq.exception import (
+    BackendCommunicationErrorException,
+    PendingJobsFullException,
+)
 
 
 class FakeConnection:
@@ -9,6 +20,7 @@ class FakeConnection:
         self.event = threading.Event()
         self.sleep = sleep
         self.result = None
+        self.batches = []
 
     def connect(self):
         pass
@@ -29,6 +41,19 @@ class FakeConnection:
         self.result = job.execute()
         self.event.set()
 
+    def send_batch(self, jobs):
+        self.batches.append(len(jobs))
+
+
+class FailingConnection(FakeConnection):
+    def send(self, job):
+        raise BackendCommunicationErrorException("send failed")
+
+
+class PicklingConnection(FakeConnection):
+    def send(self, job):
+        super().send(serde.loads(serde.dumps(job)))
+
 
 class TestClient(unittest.TestCase):
     def test_client_connect(self):
@@ -61,6 +86,61 @@ class TestClient(unittest.TestCase):
         self.assertEqual(r.unwrap(), 11)
         client.disconnect()
 
+    def test_client_results_completed(self):
+        client = Client(FakeConnection(), max_completed=2)
+        client.connect()
+        for i in range(3):
+            r = client.schedule(lambda x: x + 1, i)
+            self.assertEqual(r.unwrap(), i + 1)
+        client.disconnect()
+        self.assertEqual(client.pending_results(), {})
+        self.assertEqual(len(client.results), 2)
+
+    def test_client_schedule_await(self):
+        client = Client(FakeConnection())
+        client.connect()
+
+        async def schedule():
+            return await client.schedule(lambda x: x + 1, 10)
+
+        result = asyncio.run(schedule())
+        self.assertEqual(result.value, 11)
+        client.disconnect()
+
+    def test_client_schedule_send_error(self):
+        client = Client(FailingConnection())
+        client.connect()
+        r = client.schedule(lambda x: x + 1, 10)
+        with self.assertRaises(BackendCommunicationErrorException):
+            r.result(1)
+        self.assertEqual(client.pending_results(), {})
+        client.disconnect()
+
+    def test_client_schedule_unpicklable(self):
+        client = Client(PicklingConnection())
+        client.connect()
+        r = client.schedule(lambda x: x, threading.Lock())
+        with self.assertRaises(TypeError):
+            r.result(1)
+        self.assertTrue(client._sender.is_alive())
+        r = client.schedule(lambda x: x + 1, 10)
+        self.assertEqual(r.result(1).value, 11)
+        self.assertTrue(client.join(1))
+        client.disconnect()
+
+    def test_client_schedule_many(self):
+        conn = FakeConnection()
+        client = Client(conn)
+        client.connect()
+        futures = client.schedule_many(
+            lambda x: x + 1, [((i,), {}) for i in range(5)], batch=2
+        )
+        self.assertEqual(len(futures), 5)
+        self.assertTrue(all(isinstance(f, TasqFuture) for f in futures))
+        self.assertEqual(len(client.pending_results()), 5)
+        client.disconnect()
+        self.assertEqual(conn.batches, [2, 2, 1])
+
     def test_client_schedule_blocking(self):
         client = Client(FakeConnection(1))
         client.connect()
@@ -69,14 +149,78 @@ class TestClient(unittest.TestCase):
         self.assertTrue(not client._gather_loop.is_set())
         t1 = time.time()
         r = client.schedule(lambda x: x + 1, 10)
-        t2 = time.time()
-        self.assertAlmostEqual(t2 - t1, 1, delta=0.1)
+        self.assertLess(time.time() - t1, 0.5)
         self.assertTrue(isinstance(r, TasqFuture))
         self.assertEqual(r.unwrap(), 11)
+        t2 = time.time()
+        self.assertAlmostEqual(t2 - t1, 1, delta=0.1)
+        client.disconnect()
+
+    def test_client_context_manager_drain(self):
+        with Client(FakeConnection()) as client:
+            r = client.schedule(lambda x: x + 1, 10)
+        self.assertTrue(r.done())
+        self.assertEqual(client.pending_results(), {})
+        self.assertFalse(client.is_connected())
+
+    def test_client_schedule_pending_full(self):
+        client = Client(FakeConnection(), max_pending=2)
+        for i in range(3):
+            client.schedule(lambda x, i=i: x + i, 10)
+        self.assertEqual([j.func(10) for j in client.pending_jobs()], [11, 12])
+        client = Client(
+            FakeConnection(), max_pending=2, pending_policy="discard-new"
+        )
+        client.schedule_many(lambda x: x, [((i,), {}) for i in range(3)])
+        self.assertEqual([j.args for j in client.pending_jobs()], [(0,), (1,)])
+        client = Client(
+            FakeConnection(), max_pending=1, pending_policy="raise"
+        )
+        client.schedule(lambda x: x + 1, 10)
+        with self.assertRaises(PendingJobsFullException):
+            client.schedule(lambda x: x + 1, 10)
+        self.assertEqual(len(client.pending_jobs()), 1)
+
+    def test_client_join(self):
+        conn = FakeConnection()
+        client = Client(conn)
+        client.connect()
+        self.assertTrue(client.join(0))
+        client.schedule_many(lambda x: x + 1, [((1,), {})])
+        # FakeConnection.send_batch never produces results
+        self.assertFalse(client.join(0.1))
         client.disconnect()
 
+    def test_client_join_resolved(self):
+        set_result = TasqFuture.set_result
+        set_exception = TasqFuture.set_exception
+
+        def slow_set_result(future, result):
+            time.sleep(0.05)
+            set_result(future, result)
+
+        def slow_set_exception(future, exc):
+            time.sleep(0.05)
+            set_exception(future, exc)
+
+        with patch.object(TasqFuture, "set_result", slow_set_result):
+            client = Client(FakeConnection())
+            client.connect()
+            r = client.schedule(lambda x: x + 1, 10)
+            self.assertTrue(client.join(1))
+            self.assertTrue(r.done())
+            client.disconnect()
+        with patch.object(TasqFuture, "set_exception", slow_set_exception):
+            client = Client(FailingConnection())
+            client.connect()
+            r = client.schedule(lambda x: x + 1, 10)
+            self.assertTrue(client.join(1))
+            self.assertTrue(r.done())
+            client.disconnect()
+
     def test_client_schedule_pending(self):
-        client = Client(FakeConnection())
+        conn = FakeConnection()
+        client = Client(conn)
         self.assertFalse(client.is_connected())
         self.assertTrue(client._gatherer is None)
         self.assertTrue(not client._gather_loop.is_set())
@@ -85,6 +229,45 @@ class TestClient(unittest.TestCase):
         self.assertTrue(r1 is None)
         self.assertTrue(r2 is None)
         self.assertTrue(len(client.pending_jobs()), 2)
+        self.assertEqual([j.func(10) for j in client.pending_jobs()], [11, 12])
         client.connect()
         self.assertTrue(all(client.pending_results()))
+        self.assertEqual(len(client.pending_jobs()), 0)
         client.disconnect()
+        self.assertEqual(conn.batches, [2])
+
+
+class TestClientsGatherer(unittest.TestCase):
+    def test_clients_gatherer_deliver(self):
+        ctx = CloudPickleContext()
+        pushes, clients = [], []
+        gatherer = ClientsGatherer(timeout=50)
+        for i in range(2):
+            push = ctx.socket(zmq.PUSH)
+            port = push.bind_to_random_port("tcp://127.0.0.1")
+            pushes.append(push)
+            conn = ZMQBackendConnection("127.0.0.1", port + 1000, port)
+            conn._pull_socket.connect(f"tcp://127.0.0.1:{port}")
+            client = Client(conn, gatherer=gatherer)
+            # Started by the first registered client only
+            self.assertEqual(gatherer.is_running(), i > 0)
+            gatherer.register(client)
+            self.assertTrue(gatherer.is_running())
+            clients.append(client)
+        futures = []
+        for i, (push, client) in enumerate(zip(pushes, clients)):
+            future = TasqFuture()
+            client._results[f"job-{i}"] = future
+            futures.append(future)
+            push.send_data(JobResult(f"job-{i}", 0, i))
+        self.assertEqual([f.result(2).value for f in futures], [0, 1])
+        self.assertTrue(all(c.pending_results() == {} for c in clients))
+        self.assertTrue(all(c._gatherer is None for c in clients))
+        gatherer.unregister(clients[0])
+        self.assertTrue(gatherer.is_running())
+        gatherer.unregister(clients[1])
+        self.assertFalse(gatherer.is_running())
+        for push, client in zip(pushes, clients):
+            push.close()
+            client.connection.close()
+        ctx.term()
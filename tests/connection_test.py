@@ -19,6 +19,10 @@ class TestConnection(unittest.TestCase):
         self.assertEqual(conn._unix, True)
         conn = ZMQBackendConnection.from_url("unix://localhost:9000")
         self.assertEqual(conn._channel, (9001, 9000))
+        conn = ZMQBackendConnection.from_url(
+            "zmq://localhost:9000?foo=bar&pull_port=9010"
+        )
+        self.assertEqual(conn._channel, (9010, 9000))
         with self.assertRaises(AssertionError):
             conn = ZMQBackendConnection.from_url(
                 "zmw://localhost:9000?pull_port=9002"
@@ -31,6 +35,10 @@ class TestConnection(unittest.TestCase):
                 "redis://localhost:6379/0?name=redis-queue"
             )
             self.assertEqual(conn._signkey, None)
+            BackendConnection.from_url(
+                "redis://localhost:6379/0?db=2&name=test-queue"
+            )
+            self.assertEqual(redis_mock.call_args[1]["name"], "test-queue")
         with patch("tasq.remote.connection.RabbitMQBackend") as amqp_mock:
             amqp_mock.return_value = None
             conn = BackendConnection.from_url(
@@ -1,5 +1,6 @@
 import time
 import unittest
+import tasq.remote.serializer as serde
 from tasq.job import Job, JobStatus, JobResult
 
 
@@ -37,3 +38,11 @@ class TestJob(unittest.TestCase):
         self.assertTrue(isinstance(result, JobResult))
         self.assertEqual(result.value, 11)
         self.assertAlmostEqual(t2 - t1, 1, delta=0.1)
+
+    def test_job_serde(self):
+        job = Job("job-1", lambda x: x + 1, 10, delay=0)
+        self.assertFalse(hasattr(job, "__dict__"))
+        loaded = serde.loads(serde.dumps(job))
+        self.assertEqual(loaded.job_id, "job-1")
+        self.assertEqual(loaded.args, (10,))
+        self.assertEqual(loaded.execute().value, 11)
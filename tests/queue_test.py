@@ -1,6 +1,10 @@
 import time
 import unittest
+import threading
+import zmq
+import tasq
 from tasq import RoundRobinRouter, ClientWorker, actor_pool
+from tasq.remote.sockets import CloudPickleContext
 from tasq.queue import TasqQueue, TasqMultiQueue
 from tasq.job import JobResult
 
@@ -10,6 +14,7 @@ class FakeBackend:
         self.connected = False
         self._pending_jobs = []
         self.results = []
+        self.batches = []
 
     def connect(self):
         self.connected = True
@@ -30,6 +35,10 @@ class FakeBackend:
         self.results.append(True)
         return fut
 
+    def schedule_many(self, func, iterable, batch=64):
+        self.batches.append(len(iterable))
+        return [self.schedule(func, *a, **kw) for a, kw in iterable]
+
     def schedule_blocking(self, func, *args, **kwargs):
         from tasq.remote.client import TasqFuture
 
@@ -43,6 +52,36 @@ class FakeBackend:
         return self._pending_jobs
 
 
+class EchoWorker:
+
+    """Minimal ZMQ worker executing every job received and pushing back its
+    result
+    """
+
+    def __init__(self):
+        self._ctx = CloudPickleContext()
+        self._pull = self._ctx.socket(zmq.PULL)
+        self._push = self._ctx.socket(zmq.PUSH)
+        self.push_port = self._pull.bind_to_random_port("tcp://127.0.0.1")
+        self.pull_port = self._push.bind_to_random_port("tcp://127.0.0.1")
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.is_set():
+            if self._pull.poll(50):
+                job = self._pull.recv_data()
+                self._push.send_data(job.execute())
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self._pull.close(linger=0)
+        self._push.close(linger=0)
+        self._ctx.term()
+
+
 class TestTasqQueue(unittest.TestCase):
     def test_queue_init(self):
         tq = TasqQueue(FakeBackend())
@@ -142,3 +181,55 @@ class TestMultiTasqQueue(unittest.TestCase):
         self.assertEqual(len(tq.results()), 3)
         self.assertTrue(res)
         self.assertAlmostEqual(t2 - t1, 0.1, delta=0.1)
+
+    def test_multiqueue_map(self):
+        tq = TasqMultiQueue(
+            self.backends,
+            lambda: actor_pool(
+                num_workers=len(self.backends),
+                actor_class=ClientWorker,
+                router_class=self.router_class,
+                clients=self.backends,
+            ),
+        )
+        tq.map(lambda x: x + 1, [((i,), {}) for i in range(7)], batch=1)
+        self.assertTrue(tq.is_connected())
+        self.assertEqual([len(b.results) for b in self.backends], [3, 2, 2])
+        tq.map(lambda x: x + 1, [((i,), {}) for i in range(7)], batch=3)
+        self.assertEqual([len(b.results) for b in self.backends], [5, 5, 4])
+        self.assertEqual(
+            [b.batches[-1] for b in self.backends], [2, 3, 2]
+        )
+
+    def test_multiqueue_map_below_batch(self):
+        tq = TasqMultiQueue(
+            self.backends,
+            lambda: actor_pool(
+                num_workers=len(self.backends),
+                actor_class=ClientWorker,
+                router_class=self.router_class,
+                clients=self.backends,
+            ),
+        )
+        tq.map(lambda x: x + 1, [((i,), {}) for i in range(30)])
+        self.assertEqual([len(b.results) for b in self.backends], [10, 10, 10])
+        self.assertEqual([b.batches for b in self.backends], [[10]] * 3)
+
+    def test_multiqueue_put_after_disconnect(self):
+        worker = EchoWorker()
+        tq = tasq.multi_queue(
+            [("127.0.0.1", worker.push_port, worker.pull_port)]
+        )
+        # Started by the backends on connection only
+        self.assertFalse(tq._gatherer.is_running())
+        res = tq.put_blocking(lambda: 1, timeout=3)
+        self.assertEqual(res.value, 1)
+        self.assertTrue(tq._gatherer.is_running())
+        tq.disconnect()
+        self.assertFalse(tq._gatherer.is_running())
+        res = tq.put_blocking(lambda: 2, timeout=3)
+        self.assertEqual(res.value, 2)
+        tq.disconnect()
+        for backend in tq._backends:
+            backend.connection.close()
+        worker.stop()